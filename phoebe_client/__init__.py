@@ -4,12 +4,14 @@ __version__ = "0.1.0"
 
 from .client import PhoebeClient
 from .server_api import SessionAPI, PhoebeAPI
+from .cache import ComputeCache
 from .exceptions import PhoebeClientError, AuthenticationError, SessionError, CommandError
 
 __all__ = [
     'PhoebeClient',
     'SessionAPI',
     'PhoebeAPI',
+    'ComputeCache',
     'PhoebeClientError',
     'AuthenticationError',
     'SessionError',
@@ -0,0 +1,176 @@
+"""Persistent memoization of compute results.
+
+ComputeCache stores run_compute responses on disk, keyed by a fingerprint of
+the effective bundle state together with the compute options. Entries are
+gzip-compressed JSON files; the least recently used entries are evicted once
+the configured entry count or total size is exceeded.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .config import CONFIG, CacheConfig
+from .utils.serialization import make_json_serializable
+
+_SUFFIX = ".json.gz"
+_TMP_SUFFIX = _SUFFIX + ".tmp"
+_TMP_MAX_AGE = 3600  # seconds after which a temporary file is considered abandoned
+
+
+def fingerprint(*parts: Any) -> str:
+    """Return a stable sha256 hex digest of JSON-serializable parts."""
+    encoded = json.dumps(make_json_serializable(list(parts)), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class ComputeCache:
+    """Bounded on-disk LRU store for compute results.
+
+    Recency is tracked through file modification times, so it survives across
+    processes sharing the same cache directory. Filesystem errors while storing
+    or evicting are counted in `stats.errors` and otherwise ignored, so a
+    failing cache never fails the computation it memoizes.
+    """
+
+    def __init__(
+        self,
+        path: str | Path | None = None,
+        max_entries: int | None = None,
+        max_size_mb: float | None = None,
+        compresslevel: int = 6,
+    ):
+        cfg: CacheConfig = CONFIG.cache
+        self.path = Path(path or cfg.path).expanduser()
+        self.max_entries = max_entries if max_entries is not None else cfg.max_entries
+        size_mb = max_size_mb if max_size_mb is not None else cfg.max_size_mb
+        self.max_bytes = int(size_mb * 1024 * 1024)
+        self.compresslevel = compresslevel
+        self.stats = CacheStats()
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def key(self, state: str, options: dict[str, Any]) -> str:
+        return fingerprint(state, options)
+
+    def _file(self, key: str) -> Path:
+        return self.path / f"{key}{_SUFFIX}"
+
+    def _scan(self) -> tuple[list[tuple[int, int, str]], int]:
+        """Return (mtime_ns, size, path) of every entry and the bytes held by
+        in-flight temporary files, removing temporary files left behind by
+        interrupted writers.
+        """
+        entries = []
+        tmp_bytes = 0
+        now = time.time()
+        with os.scandir(self.path) as it:
+            for e in it:
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue  # removed concurrently by another process
+                if e.name.endswith(_SUFFIX):
+                    entries.append((st.st_mtime_ns, st.st_size, e.path))
+                elif e.name.endswith(_TMP_SUFFIX):
+                    if now - st.st_mtime > _TMP_MAX_AGE:
+                        Path(e.path).unlink(missing_ok=True)
+                    else:
+                        tmp_bytes += st.st_size
+        return entries, tmp_bytes
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        file = self._file(key)
+        try:
+            with gzip.open(file, "rt", encoding="utf-8") as f:
+                result = json.load(f)
+        except (OSError, EOFError, ValueError):
+            # missing or corrupt entries are treated as misses
+            self.stats.misses += 1
+            return None
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        self.stats.hits += 1
+        return result
+
+    def put(self, key: str, result: dict[str, Any]) -> None:
+        data = gzip.compress(
+            json.dumps(make_json_serializable(result)).encode("utf-8"),
+            compresslevel=self.compresslevel,
+        )
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.path, suffix=_TMP_SUFFIX)
+        except OSError:
+            self.stats.errors += 1
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp, self._file(key))
+        except OSError:
+            self.stats.errors += 1
+            Path(tmp).unlink(missing_ok=True)
+            return
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self.stats.stores += 1
+        try:
+            self._evict()
+        except OSError:
+            self.stats.errors += 1
+
+    def _evict(self) -> None:
+        entries, total = self._scan()
+        entries.sort()
+        total += sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            Path(path).unlink(missing_ok=True)
+            total -= size
+            self.stats.evictions += 1
+
+    def invalidate(self, key: str | None = None) -> int:
+        """Remove a single entry, or every entry if key is None.
+
+        Returns the number of entries removed.
+        """
+        if key is not None:
+            file = self._file(key)
+            if file.exists():
+                file.unlink(missing_ok=True)
+                return 1
+            return 0
+        entries, _ = self._scan()
+        for _, _, path in entries:
+            Path(path).unlink(missing_ok=True)
+        return len(entries)
+
+    def __len__(self) -> int:
+        return len(self._scan()[0])
+
+    @property
+    def size_bytes(self) -> int:
+        entries, tmp_bytes = self._scan()
+        return tmp_bytes + sum(size for _, size, _ in entries)
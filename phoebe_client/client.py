@@ -1,14 +1,18 @@
 """Main client library that combines session and PHOEBE operations."""
 
+import hashlib
 from typing import Any
 from .server_api import SessionAPI, PhoebeAPI
 from .auth.base import AuthProvider
+from . import __version__
+from .cache import ComputeCache, fingerprint
+from .config import CONFIG
 
 
 class PhoebeClient:
     """Main PHOEBE Client providing unified access."""
 
-    def __init__(self, host: str | None = None, port: int | None = None, auth_provider: AuthProvider | None = None, auto_session: bool = False):
+    def __init__(self, host: str | None = None, port: int | None = None, auth_provider: AuthProvider | None = None, auto_session: bool = False, compute_cache: ComputeCache | None = None):
         self.host = host
         self.port = port
         self.auth_provider = auth_provider
@@ -17,20 +21,82 @@ class PhoebeClient:
         self.sessions = SessionAPI(host=host, port=port)
         self.phoebe = PhoebeAPI(host=host, port=port)
 
+        if compute_cache is None and CONFIG.cache.enabled:
+            compute_cache = ComputeCache()
+        self.compute_cache = compute_cache
+
+        # Bundle state tracked for compute cache keys; see state_fingerprint()
+        self._base_state: str | None = None
+        self._server_version: Any = None
+        self._ops: list[Any] = []
+
         if auto_session:
             self.start_session()
 
     def start_session(self, metadata: dict[str, Any] | None = None) -> dict[str, Any]:
         response = self.sessions.start_session(metadata=metadata)
         self.phoebe.set_session_id(response.get('session_id'))
+        self._server_version = response.get('phoebe_version')
+        # the default bundle depends on the server's PHOEBE version; without
+        # one reported, caching stays off until a bundle is loaded
+        self._reset_state('default' if self._server_version else None)
         return response
 
     def set_session_id(self, session_id: str):
         self.phoebe.set_session_id(session_id)
+        # the state of an existing session is unknown (other clients may have
+        # modified it), so caching stays off until a bundle is loaded
+        self._server_version = None
+        self._reset_state(None)
+
+    def invalidate_state(self):
+        """
+        Forget the tracked bundle state, turning the compute cache off until
+        the next start_session() or load_bundle(). Call this after mutating
+        the bundle through `self.phoebe.execute()` directly.
+        """
+        self._reset_state(None)
 
     def end_session(self, session_id: str):
         self.sessions.end_session(session_id)
         self.phoebe.set_session_id(None)
+        self._reset_state(None)
+
+    def _reset_state(self, base: str | None):
+        # scope the base state to the server so a shared on-disk cache never
+        # serves results computed by a different backend, PHOEBE or client version
+        if base is not None:
+            base = fingerprint(self.phoebe.base_url, self._server_version, __version__, base)
+        self._base_state = base
+        self._ops = []
+
+    def _record_value(self, value: Any, kwargs: dict[str, Any]):
+        # Values set by uniqueid are collapsed per parameter, so reverting a
+        # value restores an earlier fingerprint. Any other identifier may alias
+        # the same parameter, so those go to the ordered op log; a new value
+        # segment is started after each op to keep the ordering between them.
+        if set(kwargs) != {'uniqueid'}:
+            self._ops.append(['set_value', kwargs, value])
+            return
+        if not self._ops or not isinstance(self._ops[-1], dict):
+            self._ops.append({})
+        self._ops[-1][kwargs['uniqueid']] = value
+
+    def state_fingerprint(self) -> str | None:
+        """
+        Fingerprint of the effective bundle state, built from the bundle the
+        session started from plus the mutations issued through this client.
+        Values set by uniqueid are tracked per parameter, so reverting a value
+        restores the earlier fingerprint. Returns None if no session is active
+        or the bundle state is unknown (attached session, default bundle of a
+        server that reports no PHOEBE version, or after invalidate_state()).
+
+        Commands sent directly through `self.phoebe.execute()` are not
+        tracked; call `invalidate_state()` after such changes.
+        """
+        if self._base_state is None:
+            return None
+        return fingerprint(self._base_state, self._ops)
 
     def get_sessions(self) -> dict[str, Any]:
         return self.sessions.get_sessions()
@@ -40,6 +106,8 @@ class PhoebeClient:
             command='attach_parameters',
             args={'parameters': parameters}
         )
+        if response.get('success'):
+            self._ops.append(['attach_parameters', parameters])
         return response
 
     def get_parameter(self, qualifier: str, **kwargs) -> dict[str, Any]:
@@ -56,10 +124,14 @@ class PhoebeClient:
         return response
 
     def update_uniqueid(self, twig: str) -> dict[str, Any]:
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='update_uniqueid',
             args={'twig': twig}
         )
+        # uniqueids key tracked values, so a reassignment must change the state
+        if response.get('success'):
+            self._ops.append(['update_uniqueid', twig])
+        return response
 
     def get_value(self, **kwargs) -> Any:
         """
@@ -80,22 +152,31 @@ class PhoebeClient:
         (qualifier, context, kind, component, ...) that uniquely identify
         the parameter.
         """
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='set_value',
             args={'value': value, **kwargs}
         )
+        if response.get('success'):
+            self._record_value(value, kwargs)
+        return response
 
     def add_dataset(self, **kwargs) -> dict[str, Any]:
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='add_dataset',
             args=kwargs
         )
+        if response.get('success'):
+            self._ops.append(['add_dataset', kwargs])
+        return response
 
     def remove_dataset(self, dataset: str) -> dict[str, Any]:
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='remove_dataset',
             args={'dataset': dataset}
         )
+        if response.get('success'):
+            self._ops.append(['remove_dataset', dataset])
+        return response
 
     def get_datasets(self) -> dict[str, Any]:
         return self.phoebe.execute(
@@ -103,17 +184,45 @@ class PhoebeClient:
             args={}
         )
 
-    def run_compute(self, **kwargs) -> dict[str, Any]:
-        return self.phoebe.execute(
+    def run_compute(self, use_cache: bool = True, **kwargs) -> dict[str, Any]:
+        """
+        Run a forward model computation. If a compute cache is configured and
+        use_cache is True, results are memoized by bundle state fingerprint
+        and compute kwargs; only successful results are stored.
+
+        A cache hit does not contact the server, so the model is not added to
+        the session's bundle and server-side checks (e.g. an existing model
+        name without overwrite=True) are skipped. Pass use_cache=False when a
+        later get_value(), get_bundle() or save_bundle() needs the model.
+        """
+        state = self.state_fingerprint()
+        if self.compute_cache is None or not use_cache or state is None:
+            return self.phoebe.execute(
+                command='run_compute',
+                args=kwargs
+            )
+
+        key = self.compute_cache.key(state, kwargs)
+        cached = self.compute_cache.get(key)
+        if cached is not None:
+            return cached
+
+        response = self.phoebe.execute(
             command='run_compute',
             args=kwargs
         )
+        if response.get('success', True):
+            self.compute_cache.put(key, response)
+        return response
 
     def run_solver(self, **kwargs) -> dict[str, Any]:
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='run_solver',
             args=kwargs
         )
+        if response.get('success'):
+            self._ops.append(['run_solver', kwargs])
+        return response
 
     def get_bundle(self) -> dict[str, Any]:
         return self.phoebe.execute(
@@ -122,10 +231,13 @@ class PhoebeClient:
         )
 
     def load_bundle(self, bundle: str) -> dict[str, Any]:
-        return self.phoebe.execute(
+        response = self.phoebe.execute(
             command='load_bundle',
             args={'bundle': bundle}
         )
+        if response.get('success'):
+            self._reset_state('bundle:' + hashlib.sha256(bundle.encode('utf-8')).hexdigest())
+        return response
 
     def save_bundle(self) -> dict[str, Any]:
         return self.phoebe.execute(
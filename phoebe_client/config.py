@@ -10,6 +10,12 @@ import tomllib
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 8001
 DEFAULT_TIMEOUT = 30
+DEFAULT_CACHE_PATH = "~/.cache/phoebe_client/compute"
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_MAX_SIZE_MB = 512.0
+DEFAULT_COMPRESSION_ENCODING = "gzip"
+DEFAULT_COMPRESSION_THRESHOLD = 16384
+DEFAULT_COMPRESSION_LEVEL = 6
 
 CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.toml"
 
@@ -30,10 +36,28 @@ class AuthConfig:
     api_key: str = ""
 
 
+@dataclass(frozen=True)
+class CacheConfig:
+    enabled: bool = False
+    path: str = DEFAULT_CACHE_PATH
+    max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
+    max_size_mb: float = DEFAULT_CACHE_MAX_SIZE_MB
+
+
+@dataclass(frozen=True)
+class CompressionConfig:
+    enabled: bool = False
+    encoding: str = DEFAULT_COMPRESSION_ENCODING
+    threshold_bytes: int = DEFAULT_COMPRESSION_THRESHOLD
+    level: int = DEFAULT_COMPRESSION_LEVEL
+
+
 @dataclass(frozen=True)
 class AppConfig:
     server: ServerConfig = ServerConfig()
     auth: AuthConfig = AuthConfig()
+    cache: CacheConfig = CacheConfig()
+    compression: CompressionConfig = CompressionConfig()
 
 
 def _load_config_file() -> AppConfig:
@@ -48,6 +72,8 @@ def _load_config_file() -> AppConfig:
 
     server_data = data.get("server", {}) if isinstance(data, dict) else {}
     auth_data = data.get("auth", {}) if isinstance(data, dict) else {}
+    cache_data = data.get("cache", {}) if isinstance(data, dict) else {}
+    compression_data = data.get("compression", {}) if isinstance(data, dict) else {}
 
     server = ServerConfig(
         host=str(server_data.get("host", DEFAULT_HOST)),
@@ -55,7 +81,19 @@ def _load_config_file() -> AppConfig:
         timeout=int(server_data.get("timeout", DEFAULT_TIMEOUT)),
     )
     auth = AuthConfig(api_key=str(auth_data.get("api_key", "")))
-    return AppConfig(server=server, auth=auth)
+    cache = CacheConfig(
+        enabled=bool(cache_data.get("enabled", False)),
+        path=str(cache_data.get("path", DEFAULT_CACHE_PATH)),
+        max_entries=int(cache_data.get("max_entries", DEFAULT_CACHE_MAX_ENTRIES)),
+        max_size_mb=float(cache_data.get("max_size_mb", DEFAULT_CACHE_MAX_SIZE_MB)),
+    )
+    compression = CompressionConfig(
+        enabled=bool(compression_data.get("enabled", False)),
+        encoding=str(compression_data.get("encoding", DEFAULT_COMPRESSION_ENCODING)),
+        threshold_bytes=int(compression_data.get("threshold_bytes", DEFAULT_COMPRESSION_THRESHOLD)),
+        level=int(compression_data.get("level", DEFAULT_COMPRESSION_LEVEL)),
+    )
+    return AppConfig(server=server, auth=auth, cache=cache, compression=compression)
 
 
 # Loaded at import and treated as read-only configuration
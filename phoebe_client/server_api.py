@@ -3,17 +3,32 @@
 This module consolidates all HTTP communication with the phoebe-server:
 - BaseAPI: Shared connection plumbing (host/port/timeout, base_url, X-API-Key headers)
 - SessionAPI: Session lifecycle management (start/end sessions, memory/port status)
-- PhoebeAPI: PHOEBE command execution via unified execute() method
+- PhoebeAPI: PHOEBE command execution via unified execute() method, with optional
+  compression of large request bodies
 """
 
+import json
+import time
 import requests
 from typing import Any
 
-from .config import CONFIG, ServerConfig
+from .config import CONFIG, ServerConfig, CompressionConfig
 from .exceptions import SessionError, CommandError
+from .utils.compression import CompressionStats, check_encoding, compress
 from .utils.serialization import make_json_serializable
 
 
+def _encoding_rejected(response: requests.Response) -> bool:
+    """Whether the server refused a compressed body: 415, or a 400/422 caused
+    by the (still compressed) body failing to parse as JSON."""
+    if response.status_code == 415:
+        return True
+    if response.status_code in (400, 422):
+        text = response.text.lower()
+        return 'json_invalid' in text or 'json decode' in text
+    return False
+
+
 class BaseAPI:
     """Base class for server API clients.
 
@@ -114,6 +129,11 @@ class PhoebeAPI(BaseAPI):
     Executes PHOEBE commands via unified execute() method, which POSTs to
     /send/{session_id} with JSON payload. All commands flow through this
     single endpoint with server-side PHOEBE Bundle method dispatch.
+
+    Request bodies at or above the configured threshold are compressed and
+    sent with a Content-Encoding header; if the server refuses them, the
+    command is resent uncompressed and compression is turned off for this
+    client. Per-command sizes and CPU time are kept in `compression_stats`.
     """
 
     def __init__(
@@ -122,26 +142,75 @@ class PhoebeAPI(BaseAPI):
         port: int | None = None,
         timeout: int | None = None,
         session_id: str | None = None,
+        compression: CompressionConfig | None = None,
     ):
         super().__init__(host=host, port=port, timeout=timeout)
         self.session_id = session_id
+        self._compression = compression or CONFIG.compression
+        if self._compression.enabled:
+            check_encoding(self._compression.encoding, self._compression.level)
+        self._compression_rejected = False  # set once the server refuses a compressed body
+        self.compression_stats: dict[str, CompressionStats] = {}
 
     def set_session_id(self, session_id: str | None):
         self.session_id = session_id
 
+    def _encode_body(self, stats: CompressionStats, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """Return the request body and headers, compressing the body if it is
+        above the configured threshold and the server has not rejected
+        compressed bodies.
+        """
+        headers = self._get_headers()
+        cfg = self._compression
+        if cfg.enabled and not self._compression_rejected and len(body) >= cfg.threshold_bytes:
+            start = time.process_time()
+            data = compress(body, cfg.encoding, cfg.level)
+            stats.cpu_seconds += time.process_time() - start
+            if len(data) < len(body):
+                headers['Content-Encoding'] = cfg.encoding
+                stats.compressed += 1
+                return data, headers
+        return body, headers
+
+    def _record_response(self, stats: CompressionStats, response: requests.Response) -> None:
+        size = len(response.content)
+        wire = size
+        if response.headers.get('Content-Encoding'):
+            stats.compressed_responses += 1
+            try:
+                wire = int(response.raw.tell())  # bytes read before decoding
+            except (AttributeError, TypeError, ValueError):
+                pass
+        stats.response_bytes += size
+        stats.response_wire_bytes += wire
+
     def execute(self, command: str, args: dict[str, Any] | None = None) -> dict[str, Any]:
         if not self.session_id:
             raise ValueError('No session ID set. Call set_session_id() first.')
 
         payload: dict[str, Any] = {**(args or {}), 'command': command}
+        url = f'{self.base_url}/send/{self.session_id}'
 
         try:
-            response = requests.post(
-                f'{self.base_url}/send/{self.session_id}',
-                json=make_json_serializable(payload),
-                headers=self._get_headers(),
-                timeout=self._timeout,
-            )
+            body = json.dumps(make_json_serializable(payload), allow_nan=False).encode('utf-8')
+        except ValueError as e:
+            raise CommandError(f'Command failed: {e}') from e
+
+        stats = self.compression_stats.setdefault(command, CompressionStats())
+        stats.requests += 1
+        stats.raw_bytes += len(body)
+
+        try:
+            data, headers = self._encode_body(stats, body)
+            response = requests.post(url, data=data, headers=headers, timeout=self._timeout)
+            if 'Content-Encoding' in headers and _encoding_rejected(response):
+                # server cannot decode compressed bodies; resend and stop compressing
+                self._compression_rejected = True
+                stats.rejected += 1
+                data, headers = self._encode_body(stats, body)
+                response = requests.post(url, data=data, headers=headers, timeout=self._timeout)
+            stats.sent_bytes += len(data)
+            self._record_response(stats, response)
             response.raise_for_status()
             return response.json()
         except requests.HTTPError as e:
@@ -1,5 +1,6 @@
 """Utility functions for PHOEBE Client."""
 
 from .serialization import make_json_serializable
+from .compression import CompressionStats, check_encoding, compress
 
-__all__ = ['make_json_serializable']
+__all__ = ['make_json_serializable', 'CompressionStats', 'check_encoding', 'compress']
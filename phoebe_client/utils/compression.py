@@ -0,0 +1,71 @@
+"""Request body compression utilities."""
+
+import gzip
+from dataclasses import dataclass
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+ENCODINGS = ('gzip', 'zstd')
+
+# Valid compression levels per content encoding (inclusive)
+LEVELS = {'gzip': (0, 9), 'zstd': (1, 22)}
+
+
+def check_encoding(encoding: str, level: int | None = None) -> None:
+    """Raise if the given content encoding (and level, if passed) cannot be
+    used for request bodies."""
+
+    if encoding not in ENCODINGS:
+        raise ValueError(
+            f"Unsupported content encoding '{encoding}'. Choose from: {', '.join(ENCODINGS)}"
+        )
+    if encoding == 'zstd' and not ZSTD_AVAILABLE:
+        raise ImportError("zstandard required for zstd compression. Install: pip install zstandard")
+    if level is not None:
+        low, high = LEVELS[encoding]
+        if not low <= level <= high:
+            raise ValueError(
+                f"Invalid {encoding} compression level {level}. Choose from {low} to {high}"
+            )
+
+
+def compress(data: bytes, encoding: str, level: int) -> bytes:
+    """Compress data with the given content encoding."""
+
+    check_encoding(encoding, level)
+    if encoding == 'zstd':
+        return zstandard.ZstdCompressor(level=level).compress(data)
+    return gzip.compress(data, compresslevel=level)
+
+
+@dataclass
+class CompressionStats:
+    """Per-command request/response compression counters.
+
+    A command resent uncompressed after the server rejected its compressed
+    body counts once in `requests`/`raw_bytes`/`sent_bytes` and once in `rejected`.
+    """
+
+    requests: int = 0
+    compressed: int = 0
+    rejected: int = 0
+    raw_bytes: int = 0
+    sent_bytes: int = 0
+    cpu_seconds: float = 0.0
+    compressed_responses: int = 0
+    response_bytes: int = 0
+    response_wire_bytes: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Raw-to-sent request size ratio; values above 1 mean bytes were saved."""
+        return self.raw_bytes / self.sent_bytes if self.sent_bytes else 1.0
+
+    @property
+    def response_ratio(self) -> float:
+        """Decoded-to-wire response size ratio; values above 1 mean bytes were saved."""
+        return self.response_bytes / self.response_wire_bytes if self.response_wire_bytes else 1.0
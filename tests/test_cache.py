@@ -0,0 +1,166 @@
+"""Tests for ComputeCache and run_compute memoization."""
+
+import os
+from unittest.mock import patch
+from phoebe_client import PhoebeClient, ComputeCache
+
+
+def test_cache_roundtrip_and_stats(tmp_path):
+    cache = ComputeCache(path=tmp_path, max_entries=4, max_size_mb=1)
+    key = cache.key('state', {'model': 'latest'})
+    assert cache.get(key) is None
+    cache.put(key, {'success': True, 'result': {'fluxes': [1.0, 0.9, 1.0]}})
+    assert cache.get(key) == {'success': True, 'result': {'fluxes': [1.0, 0.9, 1.0]}}
+    assert (cache.stats.hits, cache.stats.misses, cache.stats.stores) == (1, 1, 1)
+    assert cache.invalidate(key) == 1
+    assert len(cache) == 0
+
+
+def test_cache_lru_eviction(tmp_path):
+    cache = ComputeCache(path=tmp_path, max_entries=2, max_size_mb=1)
+    cache.put('a', {'i': 0})
+    cache.put('b', {'i': 1})
+    os.utime(tmp_path / 'b.json.gz', (0, 0))  # make 'b' the least recently used
+    cache.put('c', {'i': 2})
+    assert len(cache) == 2
+    assert cache.stats.evictions == 1
+    assert cache.get('b') is None
+    assert cache.get('a') == {'i': 0}
+
+
+def test_cache_put_survives_write_errors(tmp_path):
+    cache = ComputeCache(path=tmp_path)
+    with patch('phoebe_client.cache.os.replace', side_effect=OSError('disk full')):
+        cache.put('a', {'i': 0})
+    assert cache.stats.errors == 1
+    assert len(cache) == 0
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_cache_removes_abandoned_tmp_files(tmp_path):
+    cache = ComputeCache(path=tmp_path)
+    stale = tmp_path / 'tmpabc.json.gz.tmp'
+    stale.write_bytes(b'x' * 10)
+    os.utime(stale, (0, 0))
+    cache.put('a', {'i': 0})
+    assert not stale.exists()
+
+
+def _client(tmp_path, host='test', phoebe_version='2.4.15'):
+    client = PhoebeClient(host=host, compute_cache=ComputeCache(path=tmp_path))
+    with patch('phoebe_client.server_api.SessionAPI.start_session') as mock_start:
+        mock_start.return_value = {'session_id': 'test-123', 'phoebe_version': phoebe_version}
+        client.start_session()
+    return client
+
+
+def _computes(mock_execute):
+    return [c for c in mock_execute.call_args_list if c.kwargs['command'] == 'run_compute']
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_run_compute_memoized_by_state(mock_execute, tmp_path):
+    mock_execute.return_value = {'success': True, 'result': {}}
+    client = _client(tmp_path)
+
+    client.set_value(1.5, uniqueid='U')
+    client.run_compute(model='latest')
+    client.set_value(2.0, uniqueid='U')
+    client.run_compute(model='latest')
+    client.set_value(1.5, uniqueid='U')
+    client.run_compute(model='latest')
+
+    assert len(_computes(mock_execute)) == 2
+    assert client.compute_cache.stats.hits == 1
+
+    client.run_compute(use_cache=False, model='latest')
+    assert len(_computes(mock_execute)) == 3
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_mixed_identifiers_do_not_alias(mock_execute, tmp_path):
+    mock_execute.return_value = {'success': True}
+    client = _client(tmp_path)
+
+    client.set_value(1.5, twig='period@binary')
+    client.set_value(2.0, uniqueid='U')
+    before = client.state_fingerprint()
+    client.set_value(1.5, twig='period@binary')
+    assert client.state_fingerprint() != before
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_failed_mutations_are_not_recorded(mock_execute, tmp_path):
+    client = _client(tmp_path)
+    before = client.state_fingerprint()
+
+    mock_execute.return_value = {'success': False}
+    client.set_value(9.9, uniqueid='U')
+    client.add_dataset(kind='lc', dataset='lc01')
+    client.load_bundle('{"bundle": 1}')
+    assert client.state_fingerprint() == before
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_load_bundle_resets_state(mock_execute, tmp_path):
+    mock_execute.return_value = {'success': True}
+    client = _client(tmp_path)
+
+    client.load_bundle('{"bundle": 1}')
+    loaded = client.state_fingerprint()
+    client.set_value(2.0, uniqueid='U')
+    client.load_bundle('{"bundle": 1}')
+    assert client.state_fingerprint() == loaded
+    client.load_bundle('{"bundle": 2}')
+    assert client.state_fingerprint() != loaded
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_attached_session_is_not_cached(mock_execute, tmp_path):
+    mock_execute.return_value = {'success': True}
+    client = PhoebeClient(compute_cache=ComputeCache(path=tmp_path))
+    client.set_session_id('existing-123')
+    assert client.state_fingerprint() is None
+
+    client.run_compute()
+    client.run_compute()
+    assert len(_computes(mock_execute)) == 2
+    assert len(client.compute_cache) == 0
+
+    client.load_bundle('{"bundle": 1}')
+    assert client.state_fingerprint() is not None
+
+
+def test_state_is_scoped_to_server(tmp_path):
+    a = _client(tmp_path, host='a')
+    b = _client(tmp_path, host='b')
+    assert a.state_fingerprint() != b.state_fingerprint()
+
+
+def test_default_bundle_without_version_is_not_cached(tmp_path):
+    assert _client(tmp_path, phoebe_version=None).state_fingerprint() is None
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_update_uniqueid_changes_state(mock_execute, tmp_path):
+    mock_execute.return_value = {'success': True}
+    client = _client(tmp_path)
+    client.set_value(1.5, uniqueid='U')
+    before = client.state_fingerprint()
+    client.update_uniqueid('period@binary')
+    assert client.state_fingerprint() != before
+
+
+@patch('phoebe_client.server_api.PhoebeAPI.execute')
+def test_invalidate_state_protects_other_clients(mock_execute, tmp_path):
+    a = _client(tmp_path)
+    mock_execute.return_value = {'success': True}
+    a.phoebe.execute('set_value', {'value': 9.9, 'uniqueid': 'U'})
+    a.invalidate_state()
+    mock_execute.return_value = {'success': True, 'result': 'MUTATED'}
+    a.run_compute()
+    assert len(a.compute_cache) == 0
+
+    b = _client(tmp_path)
+    mock_execute.return_value = {'success': True, 'result': 'FRESH'}
+    assert b.run_compute() == {'success': True, 'result': 'FRESH'}
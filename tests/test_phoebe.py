@@ -1,7 +1,14 @@
 """Tests for PhoebeAPI."""
 
+import gzip
+import json
+from unittest.mock import MagicMock, patch
+
 import pytest
-from phoebe_client.server_api import PhoebeAPI
+import requests
+from phoebe_client.config import CompressionConfig
+from phoebe_client.exceptions import CommandError
+from phoebe_client.server_api import PhoebeAPI, SessionAPI
 
 
 def test_phoebe_api_init():
@@ -13,3 +20,107 @@ def test_send_command_without_session_id():
     api = PhoebeAPI()
     with pytest.raises(ValueError, match="No session ID"):
         api.execute("get_value")
+
+
+def _response(status: int, body: dict | None = None, text: str = '') -> MagicMock:
+    content = json.dumps(body or {}).encode()
+    response = MagicMock(status_code=status, headers={}, content=content, text=text)
+    response.json.return_value = body or {}
+    return response
+
+
+def _api(threshold: int) -> PhoebeAPI:
+    compression = CompressionConfig(enabled=True, threshold_bytes=threshold)
+    return PhoebeAPI(session_id="test-123", compression=compression)
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_compresses_large_body(mock_post):
+    mock_post.return_value = _response(200, {'success': True})
+    api = _api(1024)
+    api.execute("attach_parameters", {'parameters': [{'qualifier': 'teff', 'value': 6000}] * 200})
+
+    headers = mock_post.call_args.kwargs['headers']
+    assert headers['Content-Encoding'] == 'gzip'
+    payload = json.loads(gzip.decompress(mock_post.call_args.kwargs['data']))
+    assert payload['command'] == 'attach_parameters'
+    stats = api.compression_stats['attach_parameters']
+    assert stats.compressed == 1
+    assert stats.ratio > 1
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_skips_compression_below_threshold(mock_post):
+    mock_post.return_value = _response(200)
+    api = _api(1024)
+    api.execute("get_value", {'twig': 'period@binary'})
+    assert 'Content-Encoding' not in mock_post.call_args.kwargs['headers']
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_falls_back_when_compression_rejected(mock_post):
+    mock_post.side_effect = [_response(415), _response(200, {'success': True})]
+    api = _api(16)
+    assert api.execute("load_bundle", {'bundle': 'x' * 100}) == {'success': True}
+
+    retry = mock_post.call_args_list[1].kwargs
+    assert 'Content-Encoding' not in retry['headers']
+    assert json.loads(retry['data'])['bundle'] == 'x' * 100
+    stats = api.compression_stats['load_bundle']
+    assert (stats.requests, stats.rejected) == (1, 1)
+    assert stats.sent_bytes == stats.raw_bytes == len(retry['data'])
+
+    mock_post.side_effect = None
+    mock_post.return_value = _response(200, {'success': True})
+    api.execute("load_bundle", {'bundle': 'x' * 100})
+    assert 'Content-Encoding' not in mock_post.call_args.kwargs['headers']
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_falls_back_on_json_decode_error(mock_post):
+    detail = '{"detail":[{"type":"json_invalid","msg":"JSON decode error"}]}'
+    decode_error = _response(422, text=detail)
+    mock_post.side_effect = [decode_error, _response(200, {'success': True})]
+    api = _api(16)
+    assert api.execute("load_bundle", {'bundle': 'x' * 100}) == {'success': True}
+    assert api.compression_stats['load_bundle'].rejected == 1
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_does_not_fall_back_on_validation_error(mock_post):
+    mock_post.return_value = _response(422, text='{"detail":[{"type":"missing"}]}')
+    error = requests.HTTPError(response=mock_post.return_value)
+    mock_post.return_value.raise_for_status.side_effect = error
+    api = _api(16)
+    with pytest.raises(CommandError):
+        api.execute("load_bundle", {'bundle': 'x' * 100})
+    assert mock_post.call_count == 1
+    assert api.compression_stats['load_bundle'].rejected == 0
+
+
+@patch('phoebe_client.server_api.requests.post')
+def test_execute_records_response_compression(mock_post):
+    response = _response(200, {'result': 'y' * 1000})
+    response.headers = {'Content-Encoding': 'gzip'}
+    response.raw.tell.return_value = 100
+    mock_post.return_value = response
+    api = _api(1024)
+    api.execute("get_bundle")
+
+    stats = api.compression_stats['get_bundle']
+    assert stats.compressed_responses == 1
+    assert stats.response_wire_bytes == 100
+    assert stats.response_ratio > 1
+
+
+def test_compression_disabled_by_default():
+    api = PhoebeAPI()
+    assert not api._compression.enabled
+    assert not hasattr(SessionAPI(), 'compression_stats')
+
+
+@pytest.mark.parametrize('level', [-1, 10, 42])
+def test_invalid_gzip_level_rejected_at_construction(level):
+    compression = CompressionConfig(enabled=True, encoding='gzip', level=level)
+    with pytest.raises(ValueError, match="compression level"):
+        PhoebeAPI(session_id="test-123", compression=compression)